@@ -14,6 +14,7 @@
 
 import argparse
 import logging
+import os
 from .core import convert_gvret_to_mf4
 
 if __name__ == "__main__":
@@ -23,10 +24,12 @@ if __name__ == "__main__":
     parser.add_argument("output_file", help="Path to save the MF4 file")
     parser.add_argument("dbc_path", help="Path to the DBC file for CAN decoding")
     parser.add_argument("--time_unit", default="us", choices=["s", "ms", "us"], help="Unit of the time column: s, ms, us (default: us)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of decoding processes (default: number of CPUs)")
     args = parser.parse_args()
     convert_gvret_to_mf4(
         input_file=args.input_file,
         output_file=args.output_file,
         dbc_path=args.dbc_path,
-        time_unit=args.time_unit
+        time_unit=args.time_unit,
+        workers=args.workers or os.cpu_count()
     )
@@ -13,46 +13,326 @@
 # limitations under the License.
 
 import logging
+import multiprocessing
 import os
+import queue
+import tempfile
+import threading
 import pandas as pd
 import numpy as np
-import binascii
+from fractions import Fraction
+from functools import partial
 from asammdf import MDF, Signal
 import cantools
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+logger = logging.getLogger(__name__)
 
 _INITIAL_ERROR_LOG_COUNT = 10
-_ERROR_LOG_INTERVAL = 10000
+_MAX_DATA_BYTES = 8
+_CSV_CHUNK_ROWS = 1_000_000
+_PREFETCH_CHUNKS = 2
+_FLOAT32_EXACT_INTEGER_LIMIT = 1 << 24
+_SIGNED_INT_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+_UNSIGNED_INT_DTYPES = (np.uint8, np.uint16, np.uint32, np.uint64)
+_TIME_UNITS_PER_SECOND = {"s": 1, "ms": 1_000, "us": 1_000_000}
 
-def convert_gvret_to_mf4(
-    input_file: str,
-    output_file: str,
-    dbc_path: str,
-    time_unit: str = "us"
-) -> None:
+# ASCII hex digit -> nibble value lookup table, 0xFF marks invalid characters
+_HEX_LUT = np.full(256, 0xFF, dtype=np.uint8)
+_HEX_LUT[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10)
+_HEX_LUT[np.frombuffer(b"abcdef", dtype=np.uint8)] = np.arange(10, 16)
+_HEX_LUT[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16)
+
+def _decode_hex_bytes(df: pd.DataFrame, hex_cols: list) -> np.ndarray:
     """
-    Convert a GVRET log file to MF4 format using a DBC file.
+    Convert the categorical two-character hex data columns into an (N, 8) uint8 array.
 
-    Args:
-        input_file (str): Path to the GVRET CSV log file.
-        output_file (str): Path to save the MF4 file.
-        dbc_path (str): Path to the DBC file for CAN decoding.
-        time_unit (str, optional): Unit of the time column ('s', 'ms', 'us'). Defaults to 'us'.
+    Each distinct hex string is decoded once through the nibble lookup table and rows are
+    mapped through the category codes, so no per-row strings are created.
+    Empty cells are treated as "00"; the payload length comes from the LEN column.
+    """
+    payloads = np.empty((len(df), len(hex_cols)), dtype=np.uint8)
+    for i, col in enumerate(hex_cols):
+        # Use the Categorical's own codes buffer; Series.cat.codes would copy it per column
+        column = df[col].array
+        categories = column.categories.astype(str)
+        codes = column.codes
+        nibbles = _HEX_LUT[categories.to_numpy(dtype="S2").view(np.uint8).reshape(-1, 2)]
+        invalid = (nibbles == 0xFF).any(axis=1) | (categories.str.len() != 2)
+        if invalid.any():
+            bad_row = df.index[int(np.argmax(np.isin(codes, np.flatnonzero(invalid))))]
+            raise ValueError(f"Invalid hex data byte at row {bad_row + 1}")
+        # The extra trailing entry maps missing cells (code -1) to 0x00
+        byte_values = np.append((nibbles[:, 0] << 4) | nibbles[:, 1], np.uint8(0))
+        payloads[:, i] = byte_values[codes]
+    return payloads
 
-    Raises:
-        ValueError: If the time_unit is not supported.
-        FileNotFoundError: If input_file or dbc_path does not exist.
-        Exception: For other errors during conversion.
+def _scale_offset(signal: cantools.database.can.Signal):
     """
+    Return the (scale, offset) pair cantools applies when decoding, or None for the identity.
 
-    # Validate input files
-    if not os.path.isfile(input_file):
-        logging.error(f"Input file not found: {input_file}")
-        raise FileNotFoundError(f"Input file not found: {input_file}")
-    if not os.path.isfile(dbc_path):
-        logging.error(f"DBC file not found: {dbc_path}")
-        raise FileNotFoundError(f"DBC file not found: {dbc_path}")
+    Integer scale/offset on integer signals are returned as ints so results stay integral,
+    mirroring cantools' LinearIntegerConversion.
+    """
+    if signal.scale == 1 and signal.offset == 0:
+        return None
+    if not signal.is_float and float(signal.scale).is_integer() and float(signal.offset).is_integer():
+        return int(signal.scale), int(signal.offset)
+    return signal.scale, signal.offset
+
+def _compile_block_decoder(msg: cantools.database.can.Message):
+    """
+    Build a vectorized decoder that decodes every frame of a message in one numpy pass.
+
+    Each payload row is loaded once as a 64-bit word; every signal is then a shift, mask,
+    branchless sign extension and scale/offset over the whole block. Big-endian signals are
+    mapped at build time to a shift on the byte-swapped word, so both byte orders share one path.
+
+    The returned function takes an (n, 8) uint8 payload block and returns one sample array
+    per signal, with the same values Message.decode(decode_choices=False) yields per frame.
+    Returns None for layouts it does not cover (multiplexed, container, or wide scaled signals).
+    """
+    if msg.is_container or msg.is_multiplexed() or msg.length > _MAX_DATA_BYTES:
+        return None
+    specs = []
+    for sig in msg.signals:
+        if sig.byte_order == "little_endian":
+            first_bit = sig.start
+            swapped, shift = False, sig.start
+        else:
+            # Motorola start bit is the MSB in sawtooth numbering; the first msg.length bytes
+            # read big-endian sit in the top bytes of the byte-swapped 64-bit word
+            first_bit = 8 * (sig.start // 8) + (7 - sig.start % 8)
+            swapped, shift = True, 64 - first_bit - sig.length
+        if first_bit < 0 or first_bit + sig.length > 8 * msg.length:
+            return None
+        if sig.is_float and sig.length not in (32, 64):
+            return None
+        conversion = _scale_offset(sig)
+        # Keep scaled integer results within int64 range
+        if conversion is not None and not sig.is_float and sig.length > 32:
+            return None
+        specs.append((sig.name, swapped, shift, sig.length, sig.is_signed, sig.is_float, conversion, _signal_dtype(sig)))
+
+    def decode_block(block: np.ndarray) -> dict:
+        words = block.view("<u8").ravel()
+        swapped_words = words.byteswap() if any(spec[1] for spec in specs) else None
+        columns = {}
+        for name, swapped, shift, length, is_signed, is_float, conversion, dtype in specs:
+            raw = ((swapped_words if swapped else words) >> np.uint64(shift)) & np.uint64((1 << length) - 1)
+            if is_float:
+                # NaN/inf payloads decode silently in cantools as well
+                with np.errstate(invalid="ignore", over="ignore"):
+                    values = raw.view(np.float64) if length == 64 else raw.astype(np.uint32).view(np.float32).astype(np.float64)
+            elif length == 64:
+                values = raw.view(np.int64) if is_signed else raw
+            else:
+                values = raw.astype(np.int64)
+                if is_signed:
+                    sign_bit = 1 << (length - 1)
+                    values = (values ^ sign_bit) - sign_bit
+            if conversion is not None:
+                with np.errstate(invalid="ignore", over="ignore"):
+                    values = values * conversion[0] + conversion[1]
+            columns[name] = values.astype(dtype, copy=False)
+        return columns
+
+    return decode_block
+
+def _signal_dtype(signal: cantools.database.can.Signal) -> np.dtype:
+    """
+    Pick the narrowest numpy dtype that holds every decoded value of a signal exactly.
+
+    Integer results (integer raw values with integer scale and offset, as cantools yields them)
+    use the smallest integer type covering the scaled raw range. Float results use float32 only
+    when every value is exactly representable in it, otherwise float64.
+    """
+    conversion = _scale_offset(signal)
+    scale, offset = conversion if conversion is not None else (1, 0)
+    if signal.is_float:
+        return np.dtype(np.float32 if signal.length == 32 and conversion is None else np.float64)
+
+    if signal.is_signed:
+        raw_bounds = (-(1 << (signal.length - 1)), (1 << (signal.length - 1)) - 1)
+    else:
+        raw_bounds = (0, (1 << signal.length) - 1)
+    if isinstance(scale, int) and isinstance(offset, int):
+        low, high = sorted(raw * scale + offset for raw in raw_bounds)
+        candidates = _SIGNED_INT_DTYPES if low < 0 else _UNSIGNED_INT_DTYPES
+        for dtype in candidates:
+            if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+                return np.dtype(dtype)
+        return np.dtype(np.float64)
+
+    # Scaled values are integer multiples of 1 / denominator (floats are dyadic);
+    # float32 is lossless when those integers fit in its 24-bit significand
+    scale, offset = Fraction(scale), Fraction(offset)
+    denominator = max(scale.denominator, offset.denominator)
+    magnitudes = [abs(raw * scale + offset) for raw in raw_bounds] + [abs(offset)]
+    if max(magnitudes) * denominator <= _FLOAT32_EXACT_INTEGER_LIMIT:
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+def _bucket_can_ids(ids: pd.Series, known_ids: np.ndarray) -> tuple:
+    """
+    Parse a categorical column of hexadecimal CAN IDs and bucket its rows per known frame ID.
+
+    Each distinct ID string is parsed and checked against the DBC once; rows are then mapped
+    through the category codes in a single gather, so parsing, unknown-ID filtering and
+    bucketing share one pass over the rows.
+    Returns (frame_ids, order, boundaries, unknown): the known frame IDs in ascending order,
+    the row order in which the rows of frame_ids[k] are order[boundaries[k]:boundaries[k + 1]]
+    (still in file order), and the row count of every unknown frame ID.
+    """
+    codes = ids.array.codes
+    if (codes < 0).any():
+        raise ValueError("Missing CAN ID in input")
+    category_ids = np.array([int(x, 16) for x in ids.array.categories.astype(str)], dtype=np.uint32)
+    category_counts = np.bincount(codes, minlength=len(category_ids))
+    is_known = np.isin(category_ids, known_ids)
+    frame_ids = np.unique(category_ids[is_known])
+    # Unknown IDs share the last group so their rows sort after every known row
+    category_groups = np.where(is_known, np.searchsorted(frame_ids, category_ids), len(frame_ids))
+    category_groups = category_groups.astype(np.min_scalar_type(len(frame_ids)))
+    order = np.argsort(category_groups[codes], kind="stable")
+    group_counts = np.zeros(len(frame_ids) + 1, dtype=np.int64)
+    np.add.at(group_counts, category_groups, category_counts)
+    boundaries = np.concatenate(([0], np.cumsum(group_counts[:-1])))
+
+    unknown = {}
+    for frame_id, count in zip(category_ids[~is_known].tolist(), category_counts[~is_known].tolist()):
+        if count:
+            unknown[frame_id] = unknown.get(frame_id, 0) + count
+    return frame_ids, order, boundaries, dict(sorted(unknown.items()))
+
+def _build_decoders(db: cantools.database.can.Database) -> dict:
+    """
+    Resolve every DBC message once, keyed by frame ID.
+
+    Each entry is (message, per-frame decode function, block decoder or None).
+    """
+    return {
+        # Turn off decode_choices to avoid decoding enumerations into strings since mf4 only supports numbers
+        msg.frame_id: (msg, partial(msg.decode, decode_choices=False), _compile_block_decoder(msg))
+        for msg in db.messages
+    }
+
+def _decode_chunk(df: pd.DataFrame, decoders: dict) -> dict:
+    """
+    Decode one chunk of the GVRET CSV into per-signal raw timestamp and sample arrays.
+
+    Returns a dict with the decoded "data" ({signal: ([timestamps], [samples])}), the number
+    of "rows", the chunk's minimum raw timestamp ("start"), per-ID "unknown" row counts,
+    the decode "error_count" and the first few decode "errors" as (row, message) pairs.
+    """
+    result = {"data": {}, "rows": len(df), "start": None, "unknown": {}, "error_count": 0, "errors": []}
+    if df.empty:
+        return result
+    data = result["data"]
+
+    def append_samples(signal, timestamps, values):
+        if signal not in data:
+            data[signal] = ([], [])  # (timestamp chunks, sample chunks)
+        data[signal][0].append(timestamps)
+        data[signal][1].append(values)
+
+    def record_error(idx, message):
+        result["error_count"] += 1
+        if len(result["errors"]) < _INITIAL_ERROR_LOG_COUNT:
+            result["errors"].append((idx + 1, message))
+
+    # Vectorized conversion of D1-D8 columns to a (N, 8) uint8 payload array (must be after reading CSV)
+    hex_cols = [f'D{i}' for i in range(1, _MAX_DATA_BYTES + 1)]
+    try:
+        payloads = _decode_hex_bytes(df, hex_cols)
+    except Exception as e:
+        logger.error("Failed to convert data bytes for some rows: %s", e)
+        raise
+    payload_lens = np.minimum(df["LEN"].to_numpy(), _MAX_DATA_BYTES)
+
+    try:
+        # Parse the hexadecimal IDs, drop unknown ones and bucket rows per CAN ID in one pass
+        known_ids = np.fromiter(decoders.keys(), dtype=np.uint32, count=len(decoders))
+        frame_ids, order, boundaries, result["unknown"] = _bucket_can_ids(df["ID"], known_ids)
+    except Exception as e:
+        logger.error("Failed to convert CAN IDs: %s", e)
+        raise
+
+    timestamps = df["Time Stamp"].to_numpy()
+    row_offset = df.index[0]
+
+    # Raw timestamps are kept as integers until the global start time is known
+    result["start"] = timestamps.min()
+
+    for k, frame_id in enumerate(frame_ids.tolist()):
+        positions = order[boundaries[k]:boundaries[k + 1]]
+        msg, decode, block_decode = decoders[frame_id]
+        group_timestamps = timestamps[positions]
+
+        if block_decode is not None:
+            # Decode the whole group at once; short frames fail like cantools' size check
+            valid = payload_lens[positions] >= msg.length
+            for pos in positions[~valid]:
+                record_error(row_offset + pos, f"Wrong data size: {payload_lens[pos]} instead of {msg.length} bytes")
+            for signal, values in block_decode(payloads[positions[valid]]).items():
+                append_samples(signal, group_timestamps[valid], values)
+            continue
+
+        # Preallocate one buffer per signal for this group; multiplexed messages
+        # only decode some signals per frame, so track which slots were filled
+        n = len(positions)
+        ts_buf = np.empty(n, dtype=np.uint64)
+        val_bufs = {sig.name: np.empty(n, dtype=_signal_dtype(sig)) for sig in msg.signals}
+        filled = {name: np.zeros(n, dtype=bool) for name in val_bufs} if msg.is_multiplexed() else None
+        # Copy the group's payloads out once; each frame is then a plain bytes
+        # slice at an 8-byte stride (cantools reverses the data, so it needs bytes)
+        group_payloads = payloads[positions].tobytes()
+        group_lens = payload_lens[positions].tolist()
+        count = 0
+        for i, (pos, timestamp, length) in enumerate(zip(positions.tolist(), group_timestamps.tolist(), group_lens)):
+            start = i * _MAX_DATA_BYTES
+            try:
+                message = decode(group_payloads[start:start + length])
+            except Exception as e:
+                record_error(row_offset + pos, str(e))
+                continue
+            ts_buf[count] = timestamp
+            for signal, value in message.items():
+                val_bufs[signal][count] = value
+                if filled is not None:
+                    filled[signal][count] = True
+            count += 1
+
+        for signal, values in val_bufs.items():
+            signal_timestamps, values = ts_buf[:count], values[:count]
+            if filled is not None:
+                mask = filled[signal][:count]
+                signal_timestamps, values = signal_timestamps[mask], values[mask]
+            append_samples(signal, signal_timestamps, values)
+
+    return result
+
+# Decoders of a worker process, built once by _init_decode_worker
+_worker_decoders = None
+
+def _init_decode_worker(dbc_path: str) -> None:
+    """Load the DBC file once per worker process."""
+    global _worker_decoders
+    _worker_decoders = _build_decoders(cantools.database.load_file(dbc_path))
+
+def _decode_chunk_in_worker(df: pd.DataFrame) -> dict:
+    """Decode a chunk in a worker process using that worker's decoders."""
+    return _decode_chunk(df, _worker_decoders)
+
+def _read_chunks(input_file: str):
+    """
+    Stream the GVRET CSV as DataFrames of at most _CSV_CHUNK_ROWS rows.
 
+    Only the needed columns are read, with compact dtypes. The row index continues across
+    chunks, so index + 1 is the row number within the file.
+    """
     # Only read needed columns
     needed_cols = ["Time Stamp", "ID", "Extended", "Dir", "Bus", "LEN"] + [f"D{i}" for i in range(1, 9)]
     # Optimize dtypes: use category for repeated strings, smallest ints for numerics
@@ -63,130 +343,295 @@ def convert_gvret_to_mf4(
         "Dir": "category",
         "Bus": np.uint8,
         "LEN": np.uint8,
-        **{f"D{i}": str for i in range(1, 9)}
+        # Data bytes take at most a few hundred distinct values, so read them as categories
+        # instead of materializing one Python string per cell
+        **{f"D{i}": "category" for i in range(1, 9)}
     }
 
-    logging.info(f"Reading input CSV: {input_file}")
     try:
-        df = pd.read_csv(
+        reader = pd.read_csv(
             input_file,
             dtype=data_types,
             usecols=needed_cols,
             index_col=False,
-            low_memory=False,
             engine='c',
-            memory_map=True
+            memory_map=True,
+            chunksize=_CSV_CHUNK_ROWS
         )
     except Exception as e:
-        logging.error(f"Failed to read input CSV: {e}")
+        logger.error("Failed to read input CSV: %s", e)
         raise
 
-    # Vectorized conversion of D1-D8 columns to bytes (must be after reading CSV)
-    hex_cols = [f'D{i}' for i in range(1, 9)]
-    df[hex_cols] = df[hex_cols].fillna('')
-    df['DataHex'] = np.char.add.reduce([df[col].values for col in hex_cols])
-    try:
-        df['Data'] = df['DataHex'].str.lower().map(binascii.unhexlify)
-    except Exception as e:
-        logging.error(f"Failed to convert data bytes for some rows: {e}")
-        raise
-    df.drop(columns=['DataHex'], inplace=True)
+    with reader:
+        while True:
+            try:
+                df = next(reader)
+            except StopIteration:
+                return
+            except Exception as e:
+                logger.error("Failed to read input CSV: %s", e)
+                raise
+
+            if "Time Stamp" not in df.columns or "ID" not in df.columns:
+                logger.error("Input CSV missing required columns: 'Time Stamp' and/or 'ID'")
+                raise ValueError("Input CSV missing required columns: 'Time Stamp' and/or 'ID'")
+            yield df
+
+def _prefetch(iterable, maxsize: int = _PREFETCH_CHUNKS):
+    """
+    Iterate over `iterable` in a background thread, keeping up to maxsize items queued.
+
+    The CSV parser runs while earlier chunks are decoded, so IO, parsing and decoding overlap.
+    Exceptions raised by the producer are re-raised in the consumer. Closing the returned
+    generator stops the producer and closes `iterable`.
+    """
+    items = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    end = object()
 
+    def put(item) -> bool:
+        # Poll so an abandoned consumer cannot leave the producer blocked forever
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+            put(end)
+        except BaseException as e:
+            put(e)
+        finally:
+            if hasattr(iterable, "close"):
+                iterable.close()
+
+    producer = threading.Thread(target=produce, name="gvret_to_mf4-reader", daemon=True)
+    producer.start()
     try:
-        db = cantools.database.load_file(dbc_path)
-    except Exception as e:
-        logging.error(f"Failed to load DBC file: {e}")
-        raise
+        while (item := items.get()) is not end:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+def _peek(iterable, count: int) -> tuple:
+    """
+    Read up to `count` items ahead and return (number read, iterator over all items).
+
+    Peeked items are dropped from the lookahead as they are handed out, so the caller does
+    not keep them alive after use.
+    """
+    iterator = iter(iterable)
+    peeked = deque(islice(iterator, count))
+
+    def items():
+        while peeked:
+            yield peeked.popleft()
+        yield from iterator
+
+    return len(peeked), items()
+
+class _SignalBuffer:
+    """
+    Append-only (raw timestamps, samples) storage for one signal, backed by temp files.
+
+    Each chunk is appended with a short-lived file handle, so no file descriptor or memory
+    map stays open per signal between chunks and decoded output does not have to fit in RAM
+    until the signal is read back for sorting.
+    """
+
+    def __init__(self, path: str, dtype: np.dtype):
+        self._paths = (path + ".ts", path + ".samples")
+        self._dtypes = (np.dtype(np.uint64), np.dtype(dtype))
+
+    def append(self, timestamps: np.ndarray, samples: np.ndarray) -> None:
+        if not np.can_cast(samples.dtype, self._dtypes[1]):
+            # Same signal name in messages with different types: widen the stored samples once
+            widened = np.result_type(samples.dtype, self._dtypes[1])
+            stored = np.fromfile(self._paths[1], dtype=self._dtypes[1]).astype(widened)
+            stored.tofile(self._paths[1])
+            self._dtypes = (self._dtypes[0], widened)
+        for path, dtype, values in zip(self._paths, self._dtypes, (timestamps, samples)):
+            with open(path, "ab") as f:
+                np.asarray(values, dtype=dtype).tofile(f)
+
+    def arrays(self) -> tuple:
+        """Read back the (raw timestamps, samples) written so far."""
+        return tuple(np.fromfile(p, dtype=d) for p, d in zip(self._paths, self._dtypes))
+
+def convert_gvret_to_mf4(
+    input_file: str,
+    output_file: str,
+    dbc_path: str,
+    time_unit: str = "us",
+    workers: int | None = None
+) -> None:
+    """
+    Convert a GVRET log file to MF4 format using a DBC file.
+
+    Args:
+        input_file (str): Path to the GVRET CSV log file.
+        output_file (str): Path to save the MF4 file.
+        dbc_path (str): Path to the DBC file for CAN decoding.
+        time_unit (str, optional): Unit of the time column ('s', 'ms', 'us'). Defaults to 'us'.
+        workers (int, optional): Number of processes decoding CSV chunks in parallel.
+            Defaults to 1, decoding in-process; files that fit in one chunk are always decoded
+            in-process. Worker processes are always started with the "spawn" method, so with
+            more than one worker the calling script must call this from an
+            `if __name__ == "__main__":` block.
 
-    if "Time Stamp" not in df.columns or "ID" not in df.columns:
-        logging.error("Input CSV missing required columns: 'Time Stamp' and/or 'ID'")
-        raise ValueError("Input CSV missing required columns: 'Time Stamp' and/or 'ID'")
+    Raises:
+        ValueError: If the time_unit is not supported.
+        FileNotFoundError: If input_file or dbc_path does not exist.
+        Exception: For other errors during conversion.
+    """
 
-    # --- Robust time and ID conversion ---
-    start_time = df["Time Stamp"].min()
-    valid_units = {"s", "ms", "us"}
-    pandas_unit = time_unit.lower()
-    if pandas_unit not in valid_units:
+    # Validate input files
+    if not os.path.isfile(input_file):
+        logger.error("Input file not found: %s", input_file)
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+    if not os.path.isfile(dbc_path):
+        logger.error("DBC file not found: %s", dbc_path)
+        raise FileNotFoundError(f"DBC file not found: {dbc_path}")
+
+    unit = time_unit.lower()
+    if unit not in _TIME_UNITS_PER_SECOND:
         raise ValueError(f"Unsupported time_unit: {time_unit}. Choose from 's', 'ms', 'us'.")
-    try:
-        df["Time Stamp"] = pd.to_timedelta(df["Time Stamp"] - start_time, unit=pandas_unit).dt.total_seconds()
-    except Exception as e:
-        logging.error(f"Failed to convert time units: {e}")
-        raise
+    workers = workers or 1
 
     try:
-        # Ensure ID is in integer format (assuming hexadecimal)
-        df["ID"] = df["ID"].astype(str).apply(lambda x: int(x, 16))
+        db = cantools.database.load_file(dbc_path)
     except Exception as e:
-        logging.error(f"Failed to convert CAN IDs: {e}")
+        logger.error("Failed to load DBC file: %s", e)
         raise
 
     mdf = MDF()
+    # Decoded samples are appended to per-signal temp files here until the MF4 is built
+    buffer_dir = tempfile.TemporaryDirectory(prefix="gvret_to_mf4_")
     data = {}
-    total_rows = len(df)
+    total_rows = 0
+    error_count = 0
+    logged_errors = 0
+    start_time = None
+    unknown_counts = {}
 
-    # Use itertuples(name=None) and access columns by index for robustness
-    col_idx = {col: i for i, col in enumerate(df.columns)}
-    idx_time = col_idx['Time Stamp']
-    idx_id = col_idx['ID']
-    idx_data = col_idx['Data']
+    def merge(result):
+        nonlocal total_rows, error_count, logged_errors, start_time
+        total_rows += result["rows"]
+        if result["start"] is not None:
+            start_time = result["start"] if start_time is None else min(start_time, result["start"])
+        for frame_id, count in result["unknown"].items():
+            unknown_counts[frame_id] = unknown_counts.get(frame_id, 0) + count
+        # Only log the first few decode errors for speed, then summarize at the end
+        for row, message in result["errors"]:
+            if logged_errors < _INITIAL_ERROR_LOG_COUNT:
+                logger.error("Failed to decode message at row %d: %s", row, message)
+                logged_errors += 1
+        error_count += result["error_count"]
+        for signal, (timestamps, samples) in result["data"].items():
+            for ts_chunk, sample_chunk in zip(timestamps, samples):
+                if signal not in data:
+                    data[signal] = _SignalBuffer(os.path.join(buffer_dir.name, str(len(data))), sample_chunk.dtype)
+                data[signal].append(ts_chunk, sample_chunk)
 
-    # Only log at start/end and on error for speed
-    logging.info(f"Starting CAN message decoding for {total_rows} rows...")
-    for idx, row in enumerate(df.itertuples(index=False, name=None), 1):
-        try:
-            # Turn off decode_choices to avoid decoding enumerations into strings since mf4 only supports numbers
-            message = db.decode_message(row[idx_id], bytes(row[idx_data]), decode_choices=False)
-        except KeyError:
-            logging.warning(f"Unknown CAN ID {row[idx_id]} at row {idx}, skipping")
-            continue
-        except Exception as e:
-            if idx < _INITIAL_ERROR_LOG_COUNT or idx % _ERROR_LOG_INTERVAL == 0:
-                logging.error(f"Failed to decode message at row {idx}: {e}")
-            continue
-        timestamp = row[idx_time]
-        if timestamp is None or pd.isna(timestamp):
-            logging.warning(f"Invalid timestamp at row {idx}, skipping")
-            continue
-        for signal, value in message.items():
-            if signal not in data:
-                data[signal] = ([], [])  # (timestamps, samples)
-            data[signal][0].append(timestamp)
-            data[signal][1].append(value)
-
-    # Sort to ensure that each signal’s samples are in strictly increasing timestamp order in the MF4 file
-    logging.info(f"File {input_file} converted successfully, sorting")
-    def sort_and_create_signal(args):
-        key, value = args
-        timestamps, samples = value[0], value[1]
-        timestamps = np.array(timestamps)
-        samples = np.array(samples)
-        if len(timestamps) == 0:
-            return None
-        order = np.argsort(timestamps)
-        sorted_timestamps = timestamps[order]
-        sorted_samples = samples[order]
-        # Vectorized strictly increasing filter
-        mask = np.concatenate(([True], sorted_timestamps[1:] > sorted_timestamps[:-1]))
-        if not np.any(mask):
-            return None
-        sig = Signal(
-            samples=sorted_samples[mask],
-            timestamps=sorted_timestamps[mask],
-            name=key,
-            encoding='utf-8',
-            unit=''
-        )
-        return sig
+    # Stream the CSV in fixed-size chunks so peak memory is bounded by the chunk, not the file,
+    # and parse upcoming chunks in a background thread while the current ones are decoded
+    reader = _prefetch(_read_chunks(input_file))
+    try:
+        logger.info("Reading and decoding input CSV: %s", input_file)
+        chunk_count, chunks = _peek(reader, 2)
 
-    with ThreadPoolExecutor() as executor:
-        for sig in executor.map(sort_and_create_signal, data.items()):
-            if sig is not None:
-                mdf.append(sig)
+        if workers > 1 and chunk_count > 1:
+            # Decode chunks in worker processes and merge results in file order so the output
+            # does not depend on scheduling. At most workers + 1 chunks are in flight (one per
+            # worker plus one queued), so memory grows with the worker count, not the file size
+            # Spawn rather than fork: the CSV reader thread is already running, and forking a
+            # multi-threaded process can deadlock the child
+            logger.info("Decoding with %d worker processes", workers)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_decode_worker,
+                initargs=(dbc_path,)
+            ) as executor:
+                pending = deque()
+                # map() keeps no reference to a chunk once it is submitted
+                for future in map(partial(executor.submit, _decode_chunk_in_worker), chunks):
+                    pending.append(future)
+                    if len(pending) > workers:
+                        merge(pending.popleft().result())
+                while pending:
+                    merge(pending.popleft().result())
+        else:
+            decoders = _build_decoders(db)
+            for result in map(partial(_decode_chunk, decoders=decoders), chunks):
+                merge(result)
 
-    try:
-        mdf.save(output_file)
-        logging.info(f"Saved to {output_file}")
-    except Exception as e:
-        logging.error(f"Failed to save MDF file: {e}")
-        raise
+        for frame_id, count in unknown_counts.items():
+            logger.warning("Unknown CAN ID %s (%d rows), skipping", frame_id, count)
+        if error_count:
+            logger.error("Failed to decode %d frames, skipped", error_count)
+        logger.info("Decoded CAN messages from %d rows", total_rows)
+
+        # --- Robust time conversion, relative to the earliest timestamp in the file ---
+        # One integer subtract and one float divide, no timedelta round-trip
+        def to_seconds(raw_timestamps):
+            return (raw_timestamps - start_time).astype(np.float64) / _TIME_UNITS_PER_SECOND[unit]
+
+        # Sort to ensure that each signal’s samples are in strictly increasing timestamp order in the MF4 file
+        logger.info("File %s converted successfully, sorting", input_file)
+        def sort_and_create_signal(args):
+            key, value = args
+            timestamps, samples = value.arrays()
+            try:
+                timestamps = to_seconds(timestamps)
+            except Exception as e:
+                logger.error("Failed to convert time units: %s", e)
+                raise
+            if len(timestamps) == 0:
+                return None
+            # CAN logs are almost always already in order; only sort when the O(n) check fails
+            if np.all(timestamps[1:] >= timestamps[:-1]):
+                sorted_timestamps, sorted_samples = timestamps, samples
+            else:
+                order = np.argsort(timestamps, kind='stable')
+                sorted_timestamps = timestamps[order]
+                sorted_samples = samples[order]
+            # Strictly increasing filter: the input is sorted, so comparing each timestamp with
+            # its predecessor is enough; write the comparison straight into the mask
+            keep = np.empty(len(sorted_timestamps), dtype=bool)
+            keep[0] = True
+            np.greater(sorted_timestamps[1:], sorted_timestamps[:-1], out=keep[1:])
+            sig = Signal(
+                samples=sorted_samples[keep],
+                timestamps=sorted_timestamps[keep],
+                name=key,
+                encoding='utf-8',
+                unit=''
+            )
+            return sig
+
+        with ThreadPoolExecutor() as executor:
+            for sig in executor.map(sort_and_create_signal, data.items()):
+                if sig is not None:
+                    mdf.append(sig)
+
+        try:
+            mdf.save(output_file)
+            logger.info("Saved to %s", output_file)
+        except Exception as e:
+            logger.error("Failed to save MDF file: %s", e)
+            raise
+    finally:
+        reader.close()
+        # Release the per-signal buffers before removing their files
+        data.clear()
+        buffer_dir.cleanup()
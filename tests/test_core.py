@@ -0,0 +1,128 @@
+# Copyright 2025 Boron Energy Corp.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import math
+import os
+import tempfile
+import unittest
+
+import cantools
+import numpy as np
+from asammdf import MDF
+from cantools.database.conversion import BaseConversion
+
+from gvret_to_mf4 import convert_gvret_to_mf4
+from gvret_to_mf4.core import _compile_block_decoder, _signal_dtype
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+class BlockDecoderTest(unittest.TestCase):
+    # (scale, offset): identity, integer, dyadic (exact in binary) and non-dyadic
+    CONVERSIONS = [(1, 0), (2, -40), (0.5, 0.25), (0.1, -1000)]
+
+    def assert_matches_cantools(self, signal: cantools.database.can.Signal):
+        msg = cantools.database.can.Message(frame_id=0x100, name="Msg", length=8, signals=[signal])
+        decode_block = _compile_block_decoder(msg)
+        self.assertIsNotNone(decode_block)
+
+        rng = np.random.default_rng(signal.length)
+        block = rng.integers(0, 256, size=(200, 8), dtype=np.uint8)
+        samples = decode_block(block)[signal.name]
+        self.assertEqual(samples.dtype, _signal_dtype(signal))
+        for row, stored in zip(block, samples.tolist()):
+            expected = msg.decode(row.tobytes(), decode_choices=False)[signal.name]
+            if isinstance(expected, float) and math.isnan(expected):
+                self.assertTrue(math.isnan(stored))
+            else:
+                # The narrowed dtype must hold exactly the value cantools decodes
+                self.assertEqual(stored, expected)
+
+    def test_integer_signals(self):
+        layouts = itertools.product(
+            ["little_endian", "big_endian"], [False, True], [1, 7, 12, 16, 31], self.CONVERSIONS
+        )
+        for byte_order, is_signed, length, (scale, offset) in layouts:
+            # Begin at sequential bit 3 (Motorola start bit 4) so signals straddle byte boundaries
+            start = 3 if byte_order == "little_endian" else 4
+            with self.subTest(byte_order=byte_order, is_signed=is_signed, length=length, scale=scale):
+                self.assert_matches_cantools(cantools.database.can.Signal(
+                    "Sig", start, length, byte_order=byte_order, is_signed=is_signed,
+                    conversion=BaseConversion.factory(scale=scale, offset=offset),
+                ))
+
+    def test_64_bit_integer_signals(self):
+        for byte_order, is_signed in itertools.product(["little_endian", "big_endian"], [False, True]):
+            start = 0 if byte_order == "little_endian" else 7
+            with self.subTest(byte_order=byte_order, is_signed=is_signed):
+                self.assert_matches_cantools(cantools.database.can.Signal(
+                    "Sig", start, 64, byte_order=byte_order, is_signed=is_signed
+                ))
+
+    def test_float_signals(self):
+        layouts = itertools.product(["little_endian", "big_endian"], [32, 64], self.CONVERSIONS)
+        for byte_order, length, (scale, offset) in layouts:
+            start = 0 if byte_order == "little_endian" else 7
+            with self.subTest(byte_order=byte_order, length=length, scale=scale):
+                self.assert_matches_cantools(cantools.database.can.Signal(
+                    "Sig", start, length, byte_order=byte_order, is_signed=True,
+                    conversion=BaseConversion.factory(scale=scale, offset=offset, is_float=True),
+                ))
+
+class ConvertManySignalsTest(unittest.TestCase):
+    @unittest.skipIf(resource is None, "requires the resource module")
+    def test_more_signals_than_open_file_limit(self):
+        # 80 messages x 8 signals: far more signals than file descriptors allowed below
+        messages = [
+            cantools.database.can.Message(
+                frame_id=0x100 + m,
+                name=f"Msg{m}",
+                length=8,
+                signals=[cantools.database.can.Signal(name=f"Msg{m}_Sig{s}", start=8 * s, length=8) for s in range(8)],
+            )
+            for m in range(80)
+        ]
+        db = cantools.database.can.Database(messages=messages)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            dbc_path = os.path.join(tmp, "many.dbc")
+            input_file = os.path.join(tmp, "log.csv")
+            output_file = os.path.join(tmp, "log.mf4")
+            with open(dbc_path, "w") as f:
+                f.write(db.as_dbc_string())
+            with open(input_file, "w") as f:
+                f.write("Time Stamp,ID,Extended,Dir,Bus,LEN,D1,D2,D3,D4,D5,D6,D7,D8\n")
+                for row in range(4000):
+                    data = ",".join(f"{(row + i) % 256:02X}" for i in range(8))
+                    f.write(f"{1000 + row},{0x100 + row % 80:08X},false,Rx,0,8,{data}\n")
+
+            soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (min(256, soft), hard))
+            try:
+                convert_gvret_to_mf4(input_file, output_file, dbc_path, workers=1)
+            finally:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+            with MDF(output_file) as mdf:
+                channels = {name for name in mdf.channels_db if name.startswith("Msg")}
+                self.assertEqual(len(channels), 640)
+                samples = mdf.get("Msg3_Sig2").samples
+                self.assertEqual(len(samples), 50)
+                self.assertEqual(int(samples[0]), 5)
+
+if __name__ == "__main__":
+    unittest.main()